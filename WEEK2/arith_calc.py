@@ -1,5 +1,16 @@
+import argparse
+import os
+import time
+
+import numpy as np
 import matplotlib.pyplot as plt
 
+from array_io import (DEFAULT_CHUNK_SIZE, count_csv_rows, iter_array_chunks,
+                      iter_csv_chunks, load_npy, open_npy_output)
+from vector_plot import DEFAULT_FORMATS, save_vector_plot, save_vector_plots
+
+OPERATIONS = ('add', 'sub', 'mul', 'div')
+
 class ComplexCalculator:
     def __init__(self, z1=None, z2=None):
         self.z1 = z1
@@ -27,7 +38,7 @@ class ComplexCalculator:
         div = self.results['div']
         print(f"z1 / z2 = {div if div is not None else 'undefined (division by zero)'}")
 
-    def plot_vectors(self):
+    def _vectors(self):
         vectors = [self.z1, self.z2, self.results['add'], self.results['sub'], self.results['mul']]
         labels = ['z1', 'z2', 'z1+z2', 'z1-z2', 'z1*z2']
         colors = ['blue', 'green', 'orange', 'red', 'purple']
@@ -36,6 +47,16 @@ class ComplexCalculator:
             vectors.append(self.results['div'])
             labels.append('z1/z2')
             colors.append('brown')
+        return vectors, labels, colors
+
+    def save_plot(self, path):
+        """Write the vector plot to a PNG/SVG file without opening a window."""
+        vectors, labels, colors = self._vectors()
+        save_vector_plot(path, np.array(vectors, dtype=complex), labels=labels, colors=colors,
+                         title='Complex Number Operations')
+
+    def plot_vectors(self):
+        vectors, labels, colors = self._vectors()
 
         plt.figure(figsize=(8, 8))
         ax = plt.gca()
@@ -54,14 +75,143 @@ class ComplexCalculator:
         plt.legend(labels)
         plt.show()
 
+class BatchComplexCalculator:
+    """Element-wise version of ComplexCalculator for arrays of complex numbers.
+
+    Division where z2 == 0 is masked: the in-memory result is a numpy masked
+    array and the value written to disk is nan+nanj.
+    """
+    def __init__(self, z1=None, z2=None, dtype=np.complex128):
+        self.dtype = np.dtype(dtype)
+        self.z1 = None if z1 is None else np.asarray(z1, dtype=self.dtype)
+        self.z2 = None if z2 is None else np.asarray(z2, dtype=self.dtype)
+        self.results = {}
+
+    @staticmethod
+    def compute_chunk(z1, z2, out):
+        """Fill out['add'|'sub'|'mul'|'div'] for one block and return the division mask."""
+        np.add(z1, z2, out=out['add'])
+        np.subtract(z1, z2, out=out['sub'])
+        np.multiply(z1, z2, out=out['mul'])
+        valid = z2 != 0
+        out['div'].fill(complex(np.nan, np.nan))
+        np.divide(z1, z2, out=out['div'], where=valid)
+        return ~valid
+
+    def compute(self):
+        if self.z1.shape != self.z2.shape:
+            raise ValueError(f"z1 and z2 must have the same shape, got {self.z1.shape} and {self.z2.shape}")
+        out = {op: np.empty(self.z1.shape, dtype=self.dtype) for op in OPERATIONS}
+        mask = self.compute_chunk(self.z1, self.z2, out)
+        out['div'] = np.ma.masked_array(out['div'], mask=mask)
+        self.results = out
+        return out
+
+    def save_results(self, out_dir):
+        """Write each result array to out_dir/<op>.npy."""
+        os.makedirs(out_dir, exist_ok=True)
+        for op, values in self.results.items():
+            np.save(os.path.join(out_dir, f"{op}.npy"), np.ma.filled(values, complex(np.nan, np.nan)))
+
+    def _run_chunks(self, chunks, n, out_dir):
+        outputs = {op: open_npy_output(os.path.join(out_dir, f"{op}.npy"), (n,), self.dtype) for op in OPERATIONS}
+        masked = 0
+        start_time = time.perf_counter()
+        for start, stop, z1, z2 in chunks:
+            out = {op: outputs[op][start:stop] for op in OPERATIONS}
+            masked += int(np.count_nonzero(self.compute_chunk(z1, z2, out)))
+        for values in outputs.values():
+            values.flush()
+        elapsed = time.perf_counter() - start_time
+        return {'count': n, 'masked_div': masked, 'seconds': elapsed}
+
+    def run_npy(self, z1_path, z2_path, out_dir, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Stream two memory-mapped complex .npy files through compute_chunk into out_dir."""
+        z1_all = load_npy(z1_path)
+        z2_all = load_npy(z2_path)
+        if z1_all.shape != z2_all.shape or z1_all.ndim != 1:
+            raise ValueError(f"Expected two 1-D arrays of equal length, got {z1_all.shape} and {z2_all.shape}")
+
+        def chunks():
+            for start, stop, z1 in iter_array_chunks(z1_all, chunk_size):
+                yield start, stop, z1.astype(self.dtype, copy=False), z2_all[start:stop].astype(self.dtype, copy=False)
+
+        return self._run_chunks(chunks(), len(z1_all), out_dir)
+
+    def run_csv(self, csv_path, out_dir, chunk_size=DEFAULT_CHUNK_SIZE, skip_header=0):
+        """Stream a CSV with columns z1_real,z1_imag,z2_real,z2_imag into out_dir."""
+        n = count_csv_rows(csv_path, skip_header)
+
+        def chunks():
+            start = 0
+            for block in iter_csv_chunks(csv_path, chunk_size, ncols=4, skip_header=skip_header):
+                stop = start + len(block)
+                z1 = block[:, 0] + 1j * block[:, 1]
+                z2 = block[:, 2] + 1j * block[:, 3]
+                yield start, stop, z1.astype(self.dtype, copy=False), z2.astype(self.dtype, copy=False)
+                start = stop
+
+        return self._run_chunks(chunks(), n, out_dir)
+
+    @staticmethod
+    def plot_results(out_dir, plot_dir, formats=DEFAULT_FORMATS):
+        """Render every <op>.npy in out_dir as a vector plot; large results are binned, not drawn one by one."""
+        plots = {op: load_npy(os.path.join(out_dir, f"{op}.npy")) for op in OPERATIONS}
+        return save_vector_plots(plots, plot_dir, formats=formats)
+
+
+def run_batch(args):
+    calc = BatchComplexCalculator(dtype=np.complex64 if args.float32 else np.complex128)
+    if args.csv:
+        stats = calc.run_csv(args.csv, args.out, args.chunk_size, args.skip_header)
+    else:
+        stats = calc.run_npy(args.z1, args.z2, args.out, args.chunk_size)
+    rate = stats['count'] / stats['seconds'] if stats['seconds'] > 0 else float('inf')
+    print(f"Processed {stats['count']} pairs in {stats['seconds']:.3f} s ({rate:,.0f} pairs/s)")
+    print(f"Division masked for {stats['masked_div']} pairs (z2 = 0)")
+    print(f"Results written to {os.path.join(args.out, '{add,sub,mul,div}.npy')}")
+    if args.plot_dir:
+        paths = calc.plot_results(args.out, args.plot_dir, args.plot_format)
+        print(f"Plots written: {', '.join(paths)}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Complex number arithmetic, interactive or in batch.")
+    parser.add_argument('--z1', help="complex .npy file with the first operands")
+    parser.add_argument('--z2', help="complex .npy file with the second operands")
+    parser.add_argument('--csv', help="CSV file with columns z1_real,z1_imag,z2_real,z2_imag")
+    parser.add_argument('--skip-header', type=int, default=0, help="number of CSV header lines to skip")
+    parser.add_argument('--out', default='results', help="output directory for <op>.npy files")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="pairs per chunk")
+    parser.add_argument('--plot-dir', help="write result plots to this directory instead of showing them")
+    parser.add_argument('--plot-format', nargs='+', default=list(DEFAULT_FORMATS), choices=['png', 'svg', 'pdf'],
+                        help="file formats for --plot-dir")
+    parser.add_argument('--save-plot', help="interactive mode: write the plot to this file instead of showing it")
+    parser.add_argument('--float32', action='store_true', help="compute in complex64 instead of complex128")
+    args = parser.parse_args(argv)
+    if (args.z1 is None) != (args.z2 is None):
+        parser.error("--z1 and --z2 must be given together")
+    if args.csv and args.z1:
+        parser.error("use either --csv or --z1/--z2, not both")
+    return args
+
 def main():
+    args = parse_args()
+    if args.csv or args.z1:
+        run_batch(args)
+        return
+
     print("Enter two complex numbers (rectangular form: a + bj)")
     calc = ComplexCalculator()
     calc.z1 = calc.get_complex("z1")
     calc.z2 = calc.get_complex("z2")
     calc.compute()
     calc.display_results()
-    calc.plot_vectors()
+    if args.save_plot:
+        calc.save_plot(args.save_plot)
+        print(f"Plot saved to {args.save_plot}")
+    else:
+        calc.plot_vectors()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+import itertools
+import os
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def load_npy(path, mmap=True):
+    """Open a .npy file, memory-mapped read-only by default so large files are not copied into RAM."""
+    return np.load(path, mmap_mode='r' if mmap else None)
+
+
+def iter_array_chunks(array, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (start, stop, view) slices along the first axis. Slices of a memmap stay on disk until touched."""
+    n = len(array)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        yield start, stop, array[start:stop]
+
+
+def iter_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, ncols=None, dtype=np.float64, skip_header=0):
+    """
+    Yield 2-D float blocks of at most chunk_size rows from a comma separated file.
+
+    Blank and '#' comment lines are skipped (as in count_csv_rows); with ncols, every block is checked
+    to have exactly that many columns, including single-row and single-column blocks.
+    """
+    with open(path) as f:
+        for _ in range(skip_header):
+            next(f, None)
+        while True:
+            lines = list(itertools.islice(f, chunk_size))
+            if not lines:
+                break
+            # Same rule as count_csv_rows; a chunk of only blank or comment lines yields nothing.
+            lines = [line for line in lines if line.strip() and not line.lstrip().startswith('#')]
+            if not lines:
+                continue
+            block = np.loadtxt(lines, delimiter=',', dtype=dtype, ndmin=2)
+            if ncols is not None and block.shape[1] != ncols:
+                raise ValueError(f"Expected {ncols} columns in {path}, got {block.shape[1]}")
+            yield block
+
+
+def count_csv_rows(path, skip_header=0):
+    """Count data rows in a CSV file without parsing them."""
+    with open(path, 'rb') as f:
+        for _ in range(skip_header):
+            next(f, None)
+        return sum(1 for line in f if line.strip() and not line.lstrip().startswith(b'#'))
+
+
+def open_npy_output(path, shape, dtype):
+    """Create a writable memory-mapped .npy file so results can be filled chunk by chunk."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
@@ -1,18 +1,126 @@
+import argparse
+import os
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-def polar_to_rectangular(r, theta):
-    """Convert from polar (r, theta) to rectangular (x, y) coordinates."""
-    x = r * np.cos(theta)
-    y = r * np.sin(theta)
+from array_io import (DEFAULT_CHUNK_SIZE, count_csv_rows, iter_array_chunks,
+                      iter_csv_chunks, load_npy, open_npy_output)
+from vector_plot import save_vector_plot
+
+def polar_to_rectangular(r, theta, out=None):
+    """Convert from polar (r, theta) to rectangular (x, y) coordinates.
+
+    With out=(x, y) the results are written into those arrays (which must not alias r or theta).
+    """
+    if out is None:
+        x = r * np.cos(theta)
+        y = r * np.sin(theta)
+        return x, y
+    x, y = out
+    np.cos(theta, out=x)
+    np.multiply(x, r, out=x)
+    np.sin(theta, out=y)
+    np.multiply(y, r, out=y)
     return x, y
 
-def rectangular_to_polar(x, y):
-    """Convert from rectangular (x, y) to polar (r, theta) coordinates."""
-    r = np.sqrt(x**2 + y**2)
-    theta = np.arctan2(y, x)
+def rectangular_to_polar(x, y, out=None):
+    """Convert from rectangular (x, y) to polar (r, theta) coordinates.
+
+    With out=(r, theta) the results are written into those arrays (which must not alias x or y).
+    """
+    if out is None:
+        r = np.hypot(x, y)
+        theta = np.arctan2(y, x)
+        return r, theta
+    r, theta = out
+    np.hypot(x, y, out=r)
+    np.arctan2(y, x, out=theta)
     return r, theta
 
+class ConversionPipeline:
+    """Stream (N, 2) .npy or two-column CSV files through the converters chunk by chunk.
+
+    Inputs are memory-mapped, outputs are written straight into a memory-mapped
+    (N, 2) .npy file (or appended to a CSV), and each chunk is cast into
+    preallocated scratch buffers so no per-chunk temporaries are created.
+    Angles are in radians unless degrees=True.
+    """
+    def __init__(self, direction='p2r', dtype=np.float64, degrees=False, chunk_size=DEFAULT_CHUNK_SIZE):
+        if direction not in ('p2r', 'r2p'):
+            raise ValueError(f"direction must be 'p2r' or 'r2p', got {direction!r}")
+        self.direction = direction
+        self.dtype = np.dtype(dtype)
+        self.degrees = degrees
+        self.chunk_size = chunk_size
+        self._scratch = np.empty((2, chunk_size), dtype=self.dtype)
+
+    def convert_chunk(self, block, out):
+        """Convert one (n, 2) block into out, an (n, 2) array of self.dtype."""
+        n = len(block)
+        a, b = self._scratch[0, :n], self._scratch[1, :n]
+        np.copyto(a, block[:, 0], casting='same_kind')
+        np.copyto(b, block[:, 1], casting='same_kind')
+        if self.direction == 'p2r':
+            if self.degrees:
+                np.radians(b, out=b)
+            polar_to_rectangular(a, b, out=(out[:, 0], out[:, 1]))
+        else:
+            rectangular_to_polar(a, b, out=(out[:, 0], out[:, 1]))
+            if self.degrees:
+                np.degrees(out[:, 1], out=out[:, 1])
+        return out
+
+    def _blocks(self, input_path, skip_header):
+        if input_path.endswith('.npy'):
+            data = load_npy(input_path)
+            if data.ndim != 2 or data.shape[1] != 2:
+                raise ValueError(f"Expected an (N, 2) array in {input_path}, got shape {data.shape}")
+            return len(data), (block for _, _, block in iter_array_chunks(data, self.chunk_size))
+        n = count_csv_rows(input_path, skip_header)
+        return n, iter_csv_chunks(input_path, self.chunk_size, ncols=2, skip_header=skip_header)
+
+    def run(self, input_path, output_path, skip_header=0):
+        """Convert input_path into output_path (.npy or .csv) and return throughput statistics."""
+        n, blocks = self._blocks(input_path, skip_header)
+        to_csv = output_path.endswith('.csv')
+        # Write next to the target and rename on success, so a failed run leaves no partial file.
+        tmp_path = output_path + '.tmp'
+        if to_csv:
+            out_file = open(tmp_path, 'w')
+            chunk_out = np.empty((self.chunk_size, 2), dtype=self.dtype)
+        else:
+            out_all = open_npy_output(tmp_path, (n, 2), self.dtype)
+
+        start_time = time.perf_counter()
+        start = 0
+        try:
+            for block in blocks:
+                stop = start + len(block)
+                if to_csv:
+                    out = self.convert_chunk(block, chunk_out[:len(block)])
+                    np.savetxt(out_file, out, delimiter=',')
+                else:
+                    self.convert_chunk(block, out_all[start:stop])
+                start = stop
+        except BaseException:
+            if to_csv:
+                out_file.close()
+            else:
+                del out_all
+            os.remove(tmp_path)
+            raise
+        if to_csv:
+            out_file.close()
+        else:
+            out_all.flush()
+            del out_all  # release the memmap before renaming (required on Windows)
+        os.replace(tmp_path, output_path)
+        elapsed = time.perf_counter() - start_time
+        return {'count': start, 'seconds': elapsed,
+                'elements_per_second': start / elapsed if elapsed > 0 else float('inf')}
+
 def plot_vector(x, y, r=None, theta=None, title="Complex Number Representation"):
     """Plot the vector in both rectangular and polar form."""
     plt.figure(figsize=(8, 8))
@@ -53,7 +161,49 @@ def plot_vector(x, y, r=None, theta=None, title="Complex Number Representation")
     # Show the plot
     plt.show()
 
+def save_vectors_plot(path, x, y, title="Complex Number Representation"):
+    """Plot arrays of rectangular vectors to a PNG/SVG file in one batch, without opening a window."""
+    return save_vector_plot(path, x, y, title=title)
+
+def run_pipeline(args):
+    pipeline = ConversionPipeline(args.convert, np.float32 if args.float32 else np.float64,
+                                  args.degrees, args.chunk_size)
+    stats = pipeline.run(args.input, args.output, args.skip_header)
+    print(f"Converted {stats['count']} elements in {stats['seconds']:.3f} s "
+          f"({stats['elements_per_second']:,.0f} elements/s)")
+    print(f"Output written to {args.output}")
+    if args.plot:
+        if args.output.endswith('.npy'):
+            data = load_npy(args.output)
+        else:
+            data = np.loadtxt(args.output, delimiter=',', ndmin=2)
+        xy = data if args.convert == 'p2r' else np.column_stack(
+            polar_to_rectangular(data[:, 0], np.radians(data[:, 1]) if args.degrees else data[:, 1]))
+        save_vectors_plot(args.plot, xy[:, 0], xy[:, 1], f"{args.convert} conversion")
+        print(f"Plot saved to {args.plot}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Polar/rectangular conversion, interactive or as a file pipeline.")
+    parser.add_argument('--convert', choices=['p2r', 'r2p'],
+                        help="run the file pipeline: p2r reads (r, theta) rows, r2p reads (x, y) rows")
+    parser.add_argument('--input', help="(N, 2) .npy file (memory-mapped) or two-column CSV")
+    parser.add_argument('--output', help="output .npy or .csv file")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="rows per chunk")
+    parser.add_argument('--skip-header', type=int, default=0, help="number of CSV header lines to skip")
+    parser.add_argument('--float32', action='store_true', help="compute and store in float32")
+    parser.add_argument('--degrees', action='store_true', help="angles in degrees instead of radians")
+    parser.add_argument('--plot', help="also write a PNG/SVG plot of the converted vectors")
+    args = parser.parse_args(argv)
+    if args.convert and not (args.input and args.output):
+        parser.error("--convert needs --input and --output")
+    return args
+
 def main():
+    args = parse_args()
+    if args.convert:
+        run_pipeline(args)
+        return
+
     while True:
         print("\nComplex Number Conversion")
         print("1. Polar to Rectangular")
@@ -0,0 +1,112 @@
+"""Headless, batched vector plotting.
+
+Everything here draws on matplotlib's Agg canvas directly (no pyplot), so no
+GUI window is ever opened and nothing blocks. All vectors of a plot are drawn
+by one quiver artist. When there are more vectors than horizontal pixels the
+tips are binned into a density image and only a strided subset is drawn as
+arrows.
+"""
+import os
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+DEFAULT_FORMATS = ('png',)
+
+
+def _as_xy(x, y=None):
+    """Accept either a complex array or separate real/imaginary arrays."""
+    if y is None:
+        z = np.asarray(x).ravel()
+        return z.real, z.imag
+    return np.asarray(x, dtype=float).ravel(), np.asarray(y, dtype=float).ravel()
+
+
+def _bound(x, y, percentile):
+    """Half-width of the view: a high percentile of |z|, so a few outliers cannot shrink the plot."""
+    if x.size == 0:
+        return 1.0
+    return max(float(np.percentile(np.hypot(x, y), percentile)), 1e-12) * 1.1
+
+
+def draw_vectors(ax, x, y=None, labels=None, colors=None, max_vectors=None, bins=None, percentile=99.5):
+    """Draw vectors from the origin on ax with a single quiver call.
+
+    labels/colors are per-vector and only used when every vector is drawn. The view covers the
+    given percentile of |z|; vectors beyond it are clipped and their count is shown on the plot.
+    Returns the number of vectors actually drawn as arrows.
+    """
+    x, y = _as_xy(x, y)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+        if labels is not None:
+            labels = [label for label, keep in zip(labels, finite) if keep]
+        if colors is not None:
+            colors = [color for color, keep in zip(colors, finite) if keep]
+    n = x.size
+    if max_vectors is None:
+        max_vectors = int(ax.figure.get_figwidth() * ax.figure.dpi)
+    bound = _bound(x, y, percentile)
+    outside = int(np.count_nonzero((np.abs(x) > bound) | (np.abs(y) > bound)))
+
+    if n > max_vectors:
+        bins = bins or max_vectors
+        density, xedges, yedges = np.histogram2d(x, y, bins=bins, range=[[-bound, bound], [-bound, bound]])
+        ax.imshow(np.log1p(density.T), origin='lower', extent=(-bound, bound, -bound, bound),
+                  cmap='Greys', interpolation='nearest', aspect='equal')
+        step = -(-n // max_vectors)
+        x, y = x[::step], y[::step]
+        labels = colors = None
+
+    origin = np.zeros(x.size)
+    ax.quiver(origin, origin, x, y, angles='xy', scale_units='xy', scale=1,
+              color=colors if colors is not None else 'tab:blue',
+              width=0.004 if x.size <= 50 else 0.001)
+    if labels is not None:
+        for xi, yi, label, color in zip(x, y, labels, colors if colors is not None else ['black'] * x.size):
+            ax.text(xi, yi, f' {label}', color=color, fontsize=12)
+
+    if outside:
+        ax.text(0.01, 0.99, f"{outside} vector(s) outside the view", transform=ax.transAxes,
+                va='top', fontsize=9, color='gray')
+    ax.set_xlim(-bound, bound)
+    ax.set_ylim(-bound, bound)
+    ax.set_aspect('equal')
+    ax.grid(True)
+    return x.size
+
+
+def save_vector_plot(path, x, y=None, labels=None, colors=None, title="Complex Vectors",
+                     max_vectors=None, bins=None, percentile=99.5, figsize=(8, 8), dpi=100):
+    """Render one vector plot to path; the format follows the file extension (png, svg, ...)."""
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    drawn = draw_vectors(ax, x, y, labels=labels, colors=colors, max_vectors=max_vectors, bins=bins,
+                         percentile=percentile)
+    ax.set_xlabel('Real')
+    ax.set_ylabel('Imaginary')
+    ax.set_title(title)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(path)
+    return drawn
+
+
+def save_vector_plots(plots, out_dir, formats=DEFAULT_FORMATS, **kwargs):
+    """Write a batch of plots.
+
+    plots maps a file stem to either a complex array or an (x, y) tuple.
+    Every plot is written once per format; returns the list of written paths.
+    """
+    paths = []
+    for name, data in plots.items():
+        x, y = data if isinstance(data, tuple) else (data, None)
+        for fmt in formats:
+            path = os.path.join(out_dir, f"{name}.{fmt}")
+            save_vector_plot(path, x, y, title=name, **kwargs)
+            paths.append(path)
+    return paths
@@ -0,0 +1,414 @@
+"""
+Array-backed Circuit IR
+-----------------------
+A compact circuit representation shared by the builders, the QASM emitters and the NumPy simulator.
+
+A circuit is three parallel NumPy arrays, one entry per instruction:
+- opcodes:  uint8, index into OPCODES
+- operands: int32 pairs; (qubit, -1) for 1-qubit gates, (control/first, target/second) for 2-qubit
+            gates and (qubit, clbit) for measure
+- params:   float64 rotation angle in radians (0 for gates without one)
+
+That is 17 bytes per gate, so a million-gate circuit is ~17 MB. Slicing returns views (no copy),
+save()/load() use a flat binary file that can be memory-mapped, and converters exist for qiskit
+and cirq. simulate() runs the NumPy statevector kernel, optionally over a batch of angle bindings.
+
+Requirements:
+	- numpy
+	- qiskit (only for to_qiskit/from_qiskit)
+	- cirq (only for to_cirq/from_cirq)
+"""
+
+import re
+import struct
+
+import numpy as np
+
+OPCODES = ('id', 'x', 'y', 'z', 'h', 's', 't', 'rx', 'ry', 'rz', 'cx', 'cz', 'swap', 'measure')
+OPCODE = {name: code for code, name in enumerate(OPCODES)}
+ROTATION_GATES = ('rx', 'ry', 'rz')
+TWO_QUBIT_GATES = ('cx', 'cz', 'swap')
+
+FIXED_GATES = {
+	'id': np.eye(2, dtype=complex),
+	'x': np.array([[0, 1], [1, 0]], dtype=complex),
+	'y': np.array([[0, -1j], [1j, 0]], dtype=complex),
+	'z': np.array([[1, 0], [0, -1]], dtype=complex),
+	'h': np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2),
+	's': np.array([[1, 0], [0, 1j]], dtype=complex),
+	't': np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex),
+}
+
+_MAGIC = b'QCIR'
+_VERSION = 1
+_HEADER = struct.Struct('<4sHxxIIQ')  # magic, version, num_qubits, num_clbits, count -> 24 bytes
+
+
+def rotation_matrices(gate, angles):
+	"""Return a (..., 2, 2) stack of rx/ry/rz matrices for an array of angles."""
+	half = np.asarray(angles, dtype=float) / 2
+	c, s = np.cos(half), np.sin(half)
+	m = np.zeros(half.shape + (2, 2), dtype=complex)
+	if gate == 'rx':
+		m[..., 0, 0] = c
+		m[..., 0, 1] = -1j * s
+		m[..., 1, 0] = -1j * s
+		m[..., 1, 1] = c
+	elif gate == 'ry':
+		m[..., 0, 0] = c
+		m[..., 0, 1] = -s
+		m[..., 1, 0] = s
+		m[..., 1, 1] = c
+	else:
+		m[..., 0, 0] = np.exp(-1j * half)
+		m[..., 1, 1] = np.exp(1j * half)
+	return m
+
+
+class CircuitIR:
+	"""
+	Circuit stored as parallel opcode/operand/param arrays with amortized appends.
+	"""
+	__slots__ = ('num_qubits', 'num_clbits', '_opcodes', '_operands', '_params', '_size')
+
+	def __init__(self, num_qubits, num_clbits=None, capacity=16):
+		self.num_qubits = num_qubits
+		self.num_clbits = num_qubits if num_clbits is None else num_clbits
+		self._opcodes = np.empty(capacity, dtype=np.uint8)
+		self._operands = np.empty((capacity, 2), dtype=np.int32)
+		self._params = np.empty(capacity, dtype=np.float64)
+		self._size = 0
+
+	@classmethod
+	def from_arrays(cls, num_qubits, num_clbits, opcodes, operands, params):
+		"""Wrap existing arrays without copying them."""
+		ir = cls.__new__(cls)
+		ir.num_qubits = num_qubits
+		ir.num_clbits = num_clbits
+		ir._opcodes = opcodes
+		ir._operands = operands
+		ir._params = params
+		ir._size = len(opcodes)
+		return ir
+
+	@property
+	def opcodes(self):
+		return self._opcodes[:self._size]
+
+	@property
+	def operands(self):
+		return self._operands[:self._size]
+
+	@property
+	def params(self):
+		return self._params[:self._size]
+
+	def __len__(self):
+		return self._size
+
+	def __getitem__(self, index):
+		"""A slice returns a CircuitIR viewing the same memory; an int returns (name, operands, param)."""
+		if isinstance(index, slice):
+			return CircuitIR.from_arrays(self.num_qubits, self.num_clbits,
+				self.opcodes[index], self.operands[index], self.params[index])
+		code = int(self.opcodes[index])
+		a, b = (int(v) for v in self.operands[index])
+		return OPCODES[code], ((a,) if b < 0 else (a, b)), float(self.params[index])
+
+	def __iter__(self):
+		"""Yield (name, operands, param) tuples; converts the arrays to lists once instead of per item."""
+		for code, (a, b), param in zip(self.opcodes.tolist(), self.operands.tolist(), self.params.tolist()):
+			yield OPCODES[code], ((a,) if b < 0 else (a, b)), param
+
+	def __repr__(self):
+		return f"CircuitIR(num_qubits={self.num_qubits}, num_clbits={self.num_clbits}, gates={self._size})"
+
+	def _grow(self, needed):
+		capacity = max(needed, 2 * len(self._opcodes), 16)
+		opcodes = np.empty(capacity, dtype=np.uint8)
+		operands = np.empty((capacity, 2), dtype=np.int32)
+		params = np.empty(capacity, dtype=np.float64)
+		opcodes[:self._size] = self.opcodes
+		operands[:self._size] = self.operands
+		params[:self._size] = self.params
+		self._opcodes, self._operands, self._params = opcodes, operands, params
+
+	def append(self, name, qubits, param=0.0):
+		"""Append one instruction, validating its name and operands."""
+		code = OPCODE.get(name)
+		if code is None:
+			raise ValueError(f"Unknown gate '{name}'")
+		qubits = (qubits,) if isinstance(qubits, (int, np.integer)) else tuple(qubits)
+		if name == 'measure':
+			if len(qubits) != 2 or not 0 <= qubits[0] < self.num_qubits or not 0 <= qubits[1] < self.num_clbits:
+				raise ValueError(f"measure needs (qubit, clbit), got {qubits}")
+		else:
+			arity = 2 if name in TWO_QUBIT_GATES else 1
+			if len(qubits) != arity or len(set(qubits)) != arity or any(not 0 <= q < self.num_qubits for q in qubits):
+				raise ValueError(f"Invalid qubits {qubits} for {name} on a {self.num_qubits}-qubit circuit")
+		if self._size == len(self._opcodes):
+			self._grow(self._size + 1)
+		i = self._size
+		self._opcodes[i] = code
+		self._operands[i, 0] = qubits[0]
+		self._operands[i, 1] = qubits[1] if len(qubits) > 1 else -1
+		self._params[i] = param
+		self._size += 1
+		return self
+
+	def extend(self, other):
+		"""Append every instruction of another CircuitIR in one array copy."""
+		if self._size + len(other) > len(self._opcodes):
+			self._grow(self._size + len(other))
+		end = self._size + len(other)
+		self._opcodes[self._size:end] = other.opcodes
+		self._operands[self._size:end] = other.operands
+		self._params[self._size:end] = other.params
+		self._size = end
+		return self
+
+	def measure_all(self):
+		"""Measure qubit i into clbit i for every qubit."""
+		for q in range(min(self.num_qubits, self.num_clbits)):
+			self.append('measure', (q, q))
+		return self
+
+	def copy(self):
+		return CircuitIR.from_arrays(self.num_qubits, self.num_clbits,
+			self.opcodes.copy(), self.operands.copy(), self.params.copy())
+
+	def count_ops(self):
+		"""Return {gate name: count}, computed with one bincount."""
+		counts = np.bincount(self.opcodes, minlength=len(OPCODES))
+		return {OPCODES[code]: int(n) for code, n in enumerate(counts) if n}
+
+	def depth(self):
+		"""Circuit depth, counting qubit wires and, for measure, the clbit wire (same as qiskit)."""
+		levels = np.zeros(self.num_qubits + self.num_clbits, dtype=np.int64)
+		measure = OPCODE['measure']
+		depth = 0
+		for code, (a, b) in zip(self.opcodes.tolist(), self.operands.tolist()):
+			if code == measure:
+				wires = (a, self.num_qubits + b)
+			else:
+				wires = (a,) if b < 0 else (a, b)
+			level = max(levels[w] for w in wires) + 1
+			for w in wires:
+				levels[w] = level
+			depth = max(depth, level)
+		return int(depth)
+
+	def nbytes(self):
+		return self.opcodes.nbytes + self.operands.nbytes + self.params.nbytes
+
+	# --- Binary format ---
+
+	def save(self, path):
+		"""Write a 24-byte header followed by the raw params, operands and opcodes arrays."""
+		with open(path, 'wb') as f:
+			f.write(_HEADER.pack(_MAGIC, _VERSION, self.num_qubits, self.num_clbits, self._size))
+			f.write(np.ascontiguousarray(self.params, dtype='<f8').tobytes())
+			f.write(np.ascontiguousarray(self.operands, dtype='<i4').tobytes())
+			f.write(np.ascontiguousarray(self.opcodes, dtype=np.uint8).tobytes())
+
+	@classmethod
+	def load(cls, path, mmap=False):
+		"""Read a file written by save(); with mmap=True the arrays stay on disk (read-only)."""
+		with open(path, 'rb') as f:
+			magic, version, num_qubits, num_clbits, count = _HEADER.unpack(f.read(_HEADER.size))
+		if magic != _MAGIC or version != _VERSION:
+			raise ValueError(f"{path} is not a version {_VERSION} circuit IR file")
+		offsets = (_HEADER.size, _HEADER.size + 8 * count, _HEADER.size + 16 * count)
+		if mmap:
+			params = np.memmap(path, dtype='<f8', mode='r', offset=offsets[0], shape=(count,))
+			operands = np.memmap(path, dtype='<i4', mode='r', offset=offsets[1], shape=(count, 2))
+			opcodes = np.memmap(path, dtype=np.uint8, mode='r', offset=offsets[2], shape=(count,))
+		else:
+			params = np.fromfile(path, dtype='<f8', count=count, offset=offsets[0])
+			operands = np.fromfile(path, dtype='<i4', count=2 * count, offset=offsets[1]).reshape(count, 2)
+			opcodes = np.fromfile(path, dtype=np.uint8, count=count, offset=offsets[2])
+		return cls.from_arrays(num_qubits, num_clbits, opcodes, operands, params)
+
+	# --- QASM ---
+
+	def qasm_lines(self, param_text=None):
+		"""OpenQASM 2 statements for the instructions; param_text maps an index to replacement angle text."""
+		param_text = param_text or {}
+		lines = []
+		for i, (name, qubits, param) in enumerate(self):
+			if name == 'measure':
+				lines.append(f"measure q[{qubits[0]}] -> c[{qubits[1]}];")
+				continue
+			args = ",".join(f"q[{q}]" for q in qubits)
+			if name in ROTATION_GATES:
+				lines.append(f"{name}({param_text.get(i, repr(param))}) {args};")
+			else:
+				lines.append(f"{name} {args};")
+		return lines
+
+	def qasm_header(self, include=True):
+		"""Header lines (version, include, gate definitions, registers) for qasm_lines()."""
+		lines = ["OPENQASM 2.0;"]
+		if include:
+			lines.append('include "qelib1.inc";')
+		if OPCODE['swap'] in self.opcodes:
+			# qelib1.inc has no swap; define it the way qiskit's exporter does.
+			lines.append("gate swap q0,q1 { cx q0,q1; cx q1,q0; cx q0,q1; }")
+		lines.append(f"qreg q[{self.num_qubits}];")
+		if self.num_clbits:
+			lines.append(f"creg c[{self.num_clbits}];")
+		return lines
+
+	def to_qasm(self, include=True):
+		"""Return OpenQASM 2 text; include=False omits the qelib1.inc line (Quokka)."""
+		return "\n".join(self.qasm_header(include) + self.qasm_lines()) + "\n"
+
+	# --- Framework converters ---
+
+	def to_qiskit(self):
+		from qiskit.circuit import QuantumCircuit
+		qc = QuantumCircuit(self.num_qubits, self.num_clbits)
+		for name, qubits, param in self:
+			if name in ROTATION_GATES:
+				getattr(qc, name)(param, *qubits)
+			else:
+				getattr(qc, name)(*qubits)
+		return qc
+
+	@classmethod
+	def from_qiskit(cls, qc):
+		ir = cls(qc.num_qubits, qc.num_clbits, capacity=max(len(qc.data), 16))
+		for instruction in qc.data:
+			name = instruction.operation.name
+			if name == 'barrier':
+				continue
+			qubits = [qc.find_bit(q).index for q in instruction.qubits]
+			if name == 'measure':
+				ir.append(name, (qubits[0], qc.find_bit(instruction.clbits[0]).index))
+			elif name in OPCODE:
+				ir.append(name, qubits, float(instruction.operation.params[0]) if name in ROTATION_GATES else 0.0)
+			else:
+				raise ValueError(f"Gate '{name}' is not supported by CircuitIR")
+		return ir
+
+	def to_cirq(self):
+		"""Convert to cirq.Circuit on LineQubits; clbit k becomes measurement key 'c<k>'."""
+		import cirq
+		q = cirq.LineQubit.range(self.num_qubits)
+		gates = {'id': cirq.I, 'x': cirq.X, 'y': cirq.Y, 'z': cirq.Z, 'h': cirq.H, 's': cirq.S, 't': cirq.T,
+			'cx': cirq.CNOT, 'cz': cirq.CZ, 'swap': cirq.SWAP}
+		rotations = {'rx': cirq.rx, 'ry': cirq.ry, 'rz': cirq.rz}
+		ops = []
+		for name, qubits, param in self:
+			if name == 'measure':
+				ops.append(cirq.measure(q[qubits[0]], key=f"c{qubits[1]}"))
+			elif name in rotations:
+				ops.append(rotations[name](param).on(q[qubits[0]]))
+			else:
+				ops.append(gates[name].on(*(q[i] for i in qubits)))
+		return cirq.Circuit(ops)
+
+	@classmethod
+	def from_cirq(cls, circuit, num_qubits=None, num_clbits=None):
+		"""
+		Convert a cirq.Circuit on LineQubits; LineQubit(x) becomes qubit x, so idle qubits keep their place.
+
+		num_qubits defaults to the highest LineQubit index + 1. Measurement keys of the form 'c<k>' (as
+		written by to_cirq) go to clbit k; other keys get the next free clbits, one per measured qubit.
+		num_clbits defaults to the fewest clbits that hold every measurement. A cirq circuit does not
+		record unused qubits or clbits, so pass num_qubits/num_clbits to round-trip ir.to_cirq() exactly.
+		"""
+		import cirq
+		gates = [(cirq.I, 'id'), (cirq.X, 'x'), (cirq.Y, 'y'), (cirq.Z, 'z'), (cirq.H, 'h'), (cirq.S, 's'),
+			(cirq.T, 't'), (cirq.CNOT, 'cx'), (cirq.CZ, 'cz'), (cirq.SWAP, 'swap')]
+		rotations = [(cirq.Rx, 'rx'), (cirq.Ry, 'ry'), (cirq.Rz, 'rz')]
+		qubits = circuit.all_qubits()
+		if any(not isinstance(qubit, cirq.LineQubit) for qubit in qubits):
+			raise ValueError("from_cirq only supports circuits on cirq.LineQubit")
+		if any(qubit.x < 0 for qubit in qubits):
+			raise ValueError("LineQubit indices must be non-negative")
+		needed = max((qubit.x for qubit in qubits), default=-1) + 1
+		if num_qubits is None:
+			num_qubits = needed
+		elif num_qubits < needed:
+			raise ValueError(f"Circuit uses LineQubit({needed - 1}) but num_qubits is {num_qubits}")
+		operations = list(circuit.all_operations())
+
+		def key_clbit(op):
+			match = re.fullmatch(r'c(\d+)', cirq.measurement_key_name(op))
+			return int(match.group(1)) if match and len(op.qubits) == 1 else None
+
+		measurements = [op for op in operations if cirq.is_measurement(op)]
+		clbit = max((k for k in map(key_clbit, measurements) if k is not None), default=-1) + 1
+		needed = clbit + sum(len(op.qubits) for op in measurements if key_clbit(op) is None)
+		if num_clbits is None:
+			num_clbits = needed
+		elif num_clbits < needed:
+			raise ValueError(f"Circuit measurements need {needed} clbits but num_clbits is {num_clbits}")
+		ir = cls(num_qubits, num_clbits, capacity=max(len(operations), 16))
+		for op in operations:
+			targets = [qubit.x for qubit in op.qubits]
+			if cirq.is_measurement(op):
+				k = key_clbit(op)
+				if k is not None:
+					ir.append('measure', (targets[0], k))
+					continue
+				for t in targets:
+					ir.append('measure', (t, clbit))
+					clbit += 1
+				continue
+			name = next((n for cls_, n in rotations if isinstance(op.gate, cls_)), None)
+			if name is not None:
+				ir.append(name, targets, float(op.gate.exponent * np.pi))
+				continue
+			name = next((n for gate, n in gates if op.gate == gate), None)
+			if name is None:
+				raise ValueError(f"Gate {op.gate!r} is not supported by CircuitIR")
+			ir.append(name, targets)
+		return ir
+
+def simulate(ir, batch_params=None, batch=None):
+	"""
+	Return statevectors in qiskit qubit order (qubit 0 is the least significant bit).
+
+	Without batch_params or batch the result has shape (2**n,). batch_params maps an instruction
+	index to an array of angles that replaces params[index]; all bindings are then simulated
+	together and the result has shape (bindings, 2**n). Measurements are ignored.
+	"""
+	n = ir.num_qubits
+	batch_params = batch_params or {}
+	batched = batch is not None or bool(batch_params)
+	if batch is None:
+		batch = max((len(np.atleast_1d(v)) for v in batch_params.values()), default=1)
+	state = np.zeros((batch,) + (2,) * n, dtype=complex)
+	state[(slice(None),) + (0,) * n] = 1
+	for i, (name, qubits, param) in enumerate(ir):
+		if name in ('id', 'measure'):
+			continue
+		a = qubits[0]
+		if name in TWO_QUBIT_GATES:
+			# Axis 1 + (n - 1 - q) holds qubit q; move (a, b) to axes (1, 2).
+			view = np.moveaxis(state, (n - a, n - qubits[1]), (1, 2))
+			if name == 'cx':
+				view[:, 1] = view[:, 1, ::-1].copy()
+			elif name == 'cz':
+				view[:, 1, 1] *= -1
+			else:
+				view[:, 0, 1], view[:, 1, 0] = view[:, 1, 0].copy(), view[:, 0, 1].copy()
+			continue
+		if name in ROTATION_GATES:
+			if i in batch_params:
+				m = rotation_matrices(name, np.broadcast_to(batch_params[i], (batch,)))[:, None, None]
+			else:
+				m = rotation_matrices(name, param)
+		else:
+			m = FIXED_GATES[name]
+		# View the state as (batch, higher qubits, target qubit, lower qubits) and update both halves.
+		view = state.reshape(batch, 1 << (n - 1 - a), 2, -1)
+		a0, a1 = view[:, :, 0], view[:, :, 1]
+		new0 = m[..., 0, 0] * a0 + m[..., 0, 1] * a1
+		a1 *= m[..., 1, 1]
+		a1 += m[..., 1, 0] * a0
+		a0[...] = new0
+	state = state.reshape(batch, 1 << n)
+	return state if batched else state[0]
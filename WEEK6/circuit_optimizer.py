@@ -0,0 +1,146 @@
+"""
+Peephole Circuit Optimizer
+--------------------------
+Shrinks a CircuitIR before it is exported to QASM or simulated.
+
+Passes (applied in a single streaming sweep, repeated until nothing changes):
+- Drops id gates.
+- Cancels self-inverse pairs (x, y, z, h, cx, cz, swap) acting on the same qubits.
+- Merges consecutive rx/ry/rz on the same qubit into one rotation; a merged rotation that is a
+  multiple of 2*pi is dropped (identity up to global phase).
+- Looks back through gates that commute with the new gate (diagonal gates through diagonal gates and
+  cx controls, x/rx through cx targets, cx through cx sharing only a control or only a target), so
+  pairs separated by commuting gates cancel too.
+
+The result is equivalent to the input up to a global phase.
+
+Usage:
+	from circuit_optimizer import optimize, print_report
+	optimized = optimize(circuit)
+	print_report(circuit, optimized)
+
+Requirements:
+	- numpy
+"""
+
+import itertools
+import math
+
+import numpy as np
+
+from circuit_ir import ROTATION_GATES, CircuitIR
+
+SELF_INVERSE = {'x', 'y', 'z', 'h', 'cx', 'cz', 'swap'}
+SYMMETRIC = {'cz', 'swap'}
+DIAGONAL = {'z', 's', 't', 'rz', 'cz'}
+AXIS = {'x': 'x', 'rx': 'x', 'y': 'y', 'ry': 'y', 'z': 'z', 'rz': 'z', 's': 'z', 't': 'z'}
+LOOKBACK = 32  # gates examined per qubit when searching for a partner
+
+
+def _key(name, qubits):
+	return (name, tuple(sorted(qubits)) if name in SYMMETRIC else qubits)
+
+
+def commutes(p, g):
+	"""Cheap sufficient test that gates p and g, given as (name, qubits), commute."""
+	(pn, pq), (gn, gq) = p, g
+	if not set(pq) & set(gq):
+		return True
+	if 'measure' in (pn, gn) or 'swap' in (pn, gn) or 'id' in (pn, gn):
+		return False
+	if pn in DIAGONAL and gn in DIAGONAL:
+		return True
+	if len(pq) == 1 and len(gq) == 1:
+		return AXIS.get(pn) is not None and AXIS.get(pn) == AXIS.get(gn)
+	if len(pq) == 2 and len(gq) == 2:
+		if pn == 'cx' and gn == 'cx':
+			return pq == gq or ((pq[0] == gq[0]) != (pq[1] == gq[1]) and pq[0] != gq[1] and pq[1] != gq[0])
+		cx, cz = (pq, gq) if pn == 'cx' else (gq, pq)
+		return cx[1] not in cz
+	(tn, tq), single = (p, g) if len(pq) == 2 else (g, p)
+	q = single[1][0]
+	if tn == 'cz':
+		return single[0] in DIAGONAL
+	return single[0] in DIAGONAL if q == tq[0] else AXIS.get(single[0]) == 'x'
+
+
+def _sweep(ir):
+	"""One streaming pass; returns (keep mask, params) over the instructions of ir."""
+	# Measurements only occupy their qubit here; the clbit is irrelevant for commutation.
+	gates = [(name, qubits[:1] if name == 'measure' else qubits, param) for name, qubits, param in ir]
+	keep = np.ones(len(gates), dtype=bool)
+	params = ir.params.copy()
+	stacks = [[] for _ in range(ir.num_qubits)]  # live gate indices touching each qubit, in order
+
+	def remove(j):
+		keep[j] = False
+		for q in gates[j][1]:
+			stack = stacks[q]
+			for pos in range(len(stack) - 1, -1, -1):
+				if stack[pos] == j:
+					del stack[pos]
+					break
+
+	def clear_after(j, qubit, gate):
+		# Every live gate on qubit after j must commute with gate.
+		for k in reversed(stacks[qubit]):
+			if k <= j:
+				return True
+			if not commutes((gates[k][0], gates[k][1]), gate):
+				return False
+		return True
+
+	for i, (name, qubits, param) in enumerate(gates):
+		if name == 'id':
+			keep[i] = False
+			continue
+		gate = (name, qubits)
+		if name in SELF_INVERSE or name in ROTATION_GATES:
+			key = _key(name, qubits)
+			for j in itertools.islice(reversed(stacks[qubits[0]]), LOOKBACK):
+				other = (gates[j][0], gates[j][1])
+				if _key(*other) == key:
+					if all(clear_after(j, q, gate) for q in qubits[1:]):
+						if name in ROTATION_GATES:
+							params[j] += param
+							if math.isclose(math.remainder(params[j], 2 * math.pi), 0.0, abs_tol=1e-12):
+								remove(j)
+						else:
+							remove(j)
+						keep[i] = False
+					break
+				if not commutes(other, gate):
+					break
+			if not keep[i]:
+				continue
+		for q in qubits:
+			stacks[q].append(i)
+	return keep, params
+
+
+def optimize(ir, max_passes=10):
+	"""Return an optimized copy of ir; the input is not modified."""
+	current = ir
+	for _ in range(max_passes):
+		keep, params = _sweep(current)
+		result = CircuitIR.from_arrays(current.num_qubits, current.num_clbits,
+			current.opcodes[keep], current.operands[keep], params[keep])
+		if len(result) == len(current) and np.array_equal(result.params, current.params):
+			return result
+		current = result
+	return current
+
+
+def report(before, after):
+	"""Gate count and depth before and after optimization."""
+	return {
+		'gates_before': len(before), 'gates_after': len(after),
+		'depth_before': before.depth(), 'depth_after': after.depth(),
+	}
+
+
+def print_report(before, after):
+	stats = report(before, after)
+	print(f"Optimizer: gates {stats['gates_before']} -> {stats['gates_after']}, "
+		f"depth {stats['depth_before']} -> {stats['depth_after']}")
+	return stats
@@ -8,13 +8,15 @@ Features:
 - For each qubit, allows entry of multiple gates (x, h, id, y, z, s, t, rx, ry, rz, cx) separated by commas.
 - For rx, ry, rz gates, prompts for an angle in degrees and applies the rotation.
 - For cx (CNOT), prompts for the target qubit.
+- Optimizes the circuit (drops id gates, cancels/merges redundant gates) and reports gate count and depth.
 - Builds the circuit, prints the generated QASM, saves it to 'myfile.qasm', and displays the loaded circuit.
 
 Usage:
 	python interactive_qasm_builder.py
 
 Requirements:
-	- qiskit
+	- numpy (the circuit is built as a CircuitIR, see circuit_ir.py)
+	- qiskit (to load and display the saved QASM)
 
 Example:
 	How many qubits do you want? 2
@@ -28,7 +30,9 @@ The script will then output the QASM and show the circuit.
 
 import math
 import qiskit.qasm2
-from qiskit.circuit import QuantumCircuit
+
+from circuit_ir import CircuitIR
+from circuit_optimizer import optimize, print_report
 
 
 class InteractiveQASMBuilder:
@@ -36,12 +40,12 @@ class InteractiveQASMBuilder:
 	Class to interactively build a quantum circuit and QASM file from user input.
 	"""
 	def __init__(self):
-		self.qc = None
+		self.circuit = None
 		self.n = 0
 
 	def prompt_qubits(self):
 		self.n = int(input("How many qubits do you want? "))
-		self.qc = QuantumCircuit(self.n, self.n)
+		self.circuit = CircuitIR(self.n, self.n)
 
 	def prompt_gates(self):
 		print("Available gates: x, h, id, y, z, s, t, rx, ry, rz, cx (CNOT)")
@@ -50,36 +54,30 @@ class InteractiveQASMBuilder:
 			gates = [g.strip() for g in gates_input.split(',') if g.strip()]
 			for gate in gates:
 				if gate == 'x':
-					self.qc.x(i)
+					self.circuit.append('x', i)
 				elif gate == 'h':
-					self.qc.h(i)
+					self.circuit.append('h', i)
 				elif gate == 'id':
-					self.qc.id(i)
+					self.circuit.append('id', i)
 				elif gate == 'y':
-					self.qc.y(i)
+					self.circuit.append('y', i)
 				elif gate == 'z':
-					self.qc.z(i)
+					self.circuit.append('z', i)
 				elif gate == 's':
-					self.qc.s(i)
+					self.circuit.append('s', i)
 				elif gate == 't':
-					self.qc.t(i)
+					self.circuit.append('t', i)
 				elif gate in ('rx', 'ry', 'rz'):
 					try:
 						deg = float(input(f"Enter angle in degrees for {gate} on qubit {i}: "))
-						rad = math.radians(deg)
-						if gate == 'rx':
-							self.qc.rx(rad, i)
-						elif gate == 'ry':
-							self.qc.ry(rad, i)
-						elif gate == 'rz':
-							self.qc.rz(rad, i)
+						self.circuit.append(gate, i, math.radians(deg))
 					except ValueError:
 						print("Invalid angle, skipping.")
 				elif gate == 'cx':
 					try:
 						target = int(input(f"You selected CNOT for qubit {i} as control. Enter target qubit (0 to {self.n-1}, not {i}): "))
 						if target != i and 0 <= target < self.n:
-							self.qc.cx(i, target)
+							self.circuit.append('cx', (i, target))
 						else:
 							print("Invalid target qubit for CNOT.")
 					except ValueError:
@@ -89,13 +87,19 @@ class InteractiveQASMBuilder:
 				else:
 					print(f"Unknown gate '{gate}', skipping on qubit {i}.")
 
+	def optimize(self):
+		optimized = optimize(self.circuit)
+		print_report(self.circuit, optimized)
+		self.circuit = optimized
+
 	def finalize_and_save(self):
-		self.qc.measure(range(self.n), range(self.n))
-		qasm = qiskit.qasm2.dumps(self.qc)
+		self.circuit.measure_all()
+		qasm = self.circuit.to_qasm()
 		print("\nGenerated QASM:\n")
 		print(qasm)
 
-		qiskit.qasm2.dump(self.qc, "myfile.qasm")
+		with open("myfile.qasm", "w") as f:
+			f.write(qasm)
 		print("QASM saved to myfile.qasm")
 
 		circuit = qiskit.qasm2.load("myfile.qasm")
@@ -106,6 +110,7 @@ class InteractiveQASMBuilder:
 		print("Welcome to the Interactive QASM Builder!")
 		self.prompt_qubits()
 		self.prompt_gates()
+		self.optimize()
 		self.finalize_and_save()
 
 if __name__ == "__main__":
@@ -0,0 +1,196 @@
+"""
+Parameterized Circuit Templates
+-------------------------------
+Build a circuit once with symbolic rx/ry/rz angles, then bind it to whole arrays of angle values.
+
+Features:
+- Uses the CircuitIR gate set (x, h, id, y, z, s, t, rx, ry, rz, cx, cz, swap).
+- Rotation angles are either numbers (radians) or parameter names such as theta.
+- The template is stored as a CircuitIR (circuit_ir.py), validated as gates are added and compiled once
+  into a QASM skeleton with one placeholder per symbolic angle.
+- simulate() runs every binding through the CircuitIR simulator in one vectorized pass and returns
+  a (bindings, 2**n) statevector array in qiskit's qubit ordering.
+- write_qasm() writes one QASM file per binding from the compiled skeleton, without rebuilding the circuit.
+
+Usage:
+	python parameterized_template.py --qubits 2 --gates "h 0; rx theta 0; cx 0 1" --sweep theta=0:360:100 --degrees --qasm-dir sweep
+	python parameterized_template.py --qubits 2 --gates "ry a 0; ry b 1; cx 0 1" --sweep a=0:180:50 b=90 --degrees --simulate states.npy
+
+Requirements:
+	- numpy
+	- qiskit (only for to_circuit())
+"""
+
+import argparse
+import os
+import re
+
+import numpy as np
+
+from circuit_ir import ROTATION_GATES, CircuitIR, simulate
+
+PARAMETER_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def parse_spec(text):
+	"""Parse "h 0; rx theta 0; ry 1.57 1; cx 0 1" into a list of (gate, qubits, angle) tuples."""
+	ops = []
+	for item in text.split(';'):
+		parts = item.split()
+		if not parts:
+			continue
+		gate = parts[0].lower()
+		if gate in ROTATION_GATES:
+			if len(parts) != 3:
+				raise ValueError(f"Expected '{gate} <angle|name> <qubit>', got '{item.strip()}'")
+			try:
+				angle = float(parts[1])
+			except ValueError:
+				angle = parts[1]
+			ops.append((gate, (int(parts[2]),), angle))
+		else:
+			ops.append((gate, tuple(int(q) for q in parts[1:]), None))
+	return ops
+
+
+class CircuitTemplate:
+	"""
+	A fixed gate sequence, stored as a CircuitIR, whose rotation angles may be symbolic.
+	"""
+	def __init__(self, n, ops=()):
+		self.n = n
+		self.ir = CircuitIR(n, n)
+		self.parameters = []
+		self._symbolic = {}  # instruction index -> parameter name
+		self._qasm = None
+		for gate, qubits, angle in ops:
+			self.add(gate, qubits, angle)
+
+	def add(self, gate, qubits, angle=None):
+		"""Append a gate; validation happens here so compile() never sees a bad op."""
+		gate = gate.lower()
+		if gate == 'measure':
+			raise ValueError("Templates are measured with measure=True, not with explicit measure gates")
+		if gate in ROTATION_GATES:
+			if isinstance(angle, str):
+				if not PARAMETER_NAME.match(angle):
+					raise ValueError(f"Invalid parameter name '{angle}'")
+			elif angle is None:
+				raise ValueError(f"{gate} needs an angle or a parameter name")
+		elif angle is not None:
+			raise ValueError(f"{gate} does not take an angle")
+		index = len(self.ir)
+		self.ir.append(gate, qubits, 0.0 if angle is None or isinstance(angle, str) else float(angle))
+		if isinstance(angle, str):
+			self._symbolic[index] = angle
+			if angle not in self.parameters:
+				self.parameters.append(angle)
+		self._qasm = None
+		return self
+
+	def compile(self):
+		"""Build the QASM skeleton once; later binds only fill in the angle placeholders."""
+		if self._qasm is None:
+			self._qasm = self.ir.qasm_lines({i: f"{{{name}}}" for i, name in self._symbolic.items()})
+		return self
+
+	def _bound_angles(self, values):
+		"""Broadcast the bound values to a (len(parameters), bindings) array."""
+		missing = [p for p in self.parameters if p not in values]
+		if missing:
+			raise ValueError(f"Missing values for parameter(s): {', '.join(missing)}")
+		unknown = [k for k in values if k not in self.parameters]
+		if unknown:
+			raise ValueError(f"Unknown parameter(s): {', '.join(unknown)}")
+		if not self.parameters:
+			return np.zeros((0, 1))
+		arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(values[p], dtype=float)) for p in self.parameters))
+		if arrays[0].ndim != 1:
+			raise ValueError("Parameter values must be scalars or 1-D arrays")
+		return np.stack(arrays)
+
+	def simulate(self, values=None):
+		"""Return the statevectors of every binding as a (bindings, 2**n) complex array."""
+		angles = self._bound_angles(values or {})
+		batch_params = {i: angles[self.parameters.index(name)] for i, name in self._symbolic.items()}
+		return simulate(self.ir, batch_params, batch=angles.shape[1])
+
+	def qasm_skeleton(self, include=True, measure=True):
+		"""OpenQASM 2 text with {name} placeholders for the symbolic angles."""
+		self.compile()
+		# The skeleton is filled with str.format, so braces in gate definitions are escaped.
+		header = [line.replace("{", "{{").replace("}", "}}") for line in self.ir.qasm_header(include)]
+		lines = header + self._qasm
+		if measure:
+			lines += [f"measure q[{i}] -> c[{i}];" for i in range(self.n)]
+		return "\n".join(lines) + "\n"
+
+	def write_qasm(self, values, out_dir, prefix="circuit", include=True, measure=True):
+		"""Write one QASM file per binding and return the file paths."""
+		skeleton = self.qasm_skeleton(include, measure)
+		angles = self._bound_angles(values)
+		os.makedirs(out_dir, exist_ok=True)
+		width = len(str(angles.shape[1] - 1))
+		paths = []
+		for k in range(angles.shape[1]):
+			path = os.path.join(out_dir, f"{prefix}_{k:0{width}d}.qasm")
+			with open(path, "w") as f:
+				f.write(skeleton.format(**{p: repr(float(v)) for p, v in zip(self.parameters, angles[:, k])}))
+			paths.append(path)
+		return paths
+
+	def to_circuit(self, measure=True):
+		"""Return a qiskit QuantumCircuit with qiskit Parameters for the symbolic angles."""
+		from qiskit.circuit import Parameter, QuantumCircuit
+		params = {name: Parameter(name) for name in self.parameters}
+		qc = QuantumCircuit(self.n, self.n)
+		for i, (gate, qubits, angle) in enumerate(self.ir):
+			if gate in ROTATION_GATES:
+				getattr(qc, gate)(params[self._symbolic[i]] if i in self._symbolic else angle, *qubits)
+			else:
+				getattr(qc, gate)(*qubits)
+		if measure:
+			qc.measure(range(self.n), range(self.n))
+		return qc
+
+
+def parse_sweep(items, degrees=False):
+	"""Turn ["theta=0:360:100", "phi=45"] into {name: array}; start:stop:count is inclusive."""
+	values = {}
+	for item in items:
+		name, _, spec = item.partition('=')
+		parts = [float(p) for p in spec.split(':')]
+		if len(parts) == 3:
+			arr = np.linspace(parts[0], parts[1], int(parts[2]))
+		elif len(parts) == 1:
+			arr = np.array(parts)
+		else:
+			raise ValueError(f"Invalid sweep '{item}', expected name=value or name=start:stop:count")
+		values[name.strip()] = np.radians(arr) if degrees else arr
+	return values
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Bind a parameterized circuit template to arrays of angles.")
+	parser.add_argument('--qubits', type=int, required=True)
+	parser.add_argument('--gates', required=True, help='e.g. "h 0; rx theta 0; cx 0 1" (fixed angles in radians)')
+	parser.add_argument('--sweep', nargs='*', default=[], help="name=value or name=start:stop:count")
+	parser.add_argument('--degrees', action='store_true', help="sweep values are in degrees")
+	parser.add_argument('--qasm-dir', help="write one QASM file per binding here")
+	parser.add_argument('--quokka', action='store_true', help='omit the include "qelib1.inc" line')
+	parser.add_argument('--simulate', help="save the (bindings, 2**n) statevectors to this .npy file")
+	args = parser.parse_args()
+
+	template = CircuitTemplate(args.qubits, parse_spec(args.gates)).compile()
+	values = parse_sweep(args.sweep, args.degrees)
+	print(f"Template compiled: {len(template.ir)} gates, parameters: {', '.join(template.parameters) or 'none'}")
+	if args.qasm_dir:
+		paths = template.write_qasm(values, args.qasm_dir, include=not args.quokka)
+		print(f"Wrote {len(paths)} QASM files to {args.qasm_dir}")
+	if args.simulate:
+		states = template.simulate(values)
+		np.save(args.simulate, states)
+		print(f"Saved statevectors with shape {states.shape} to {args.simulate}")
+
+if __name__ == "__main__":
+	main()
@@ -8,23 +8,25 @@ Features:
 - For each qubit, allows entry of multiple gates (x, h, id, y, z, s, t, rx, ry, rz, cx) separated by commas.
 - For rx, ry, rz gates, prompts for an angle in degrees and applies the rotation.
 - For cx (CNOT), prompts for the target qubit.
+- Optimizes the circuit (drops id gates, cancels/merges redundant gates) and reports gate count and depth.
 - Generates a QASM file named 'quokka.qasm' WITHOUT the 'include "qelib1.inc";' line (for Quokka compatibility).
 
 Usage:
     python quokka_native_qasm.py
 
 Requirements:
-    - qiskit
+    - numpy (the circuit is built as a CircuitIR, see circuit_ir.py)
 """
 
 import math
-import qiskit.qasm2
-from qiskit.circuit import QuantumCircuit
+
+from circuit_ir import CircuitIR
+from circuit_optimizer import optimize, print_report
 
 def main():
     print("Welcome to the Quokka QASM Generator!")
     n = int(input("How many qubits do you want? "))
-    qc = QuantumCircuit(n, n)
+    circuit = CircuitIR(n, n)
 
     print("Available gates: x, h, id, y, z, s, t, rx, ry, rz, cx (CNOT)")
     for i in range(n):
@@ -32,36 +34,30 @@ def main():
         gates = [g.strip() for g in gates_input.split(',') if g.strip()]
         for gate in gates:
             if gate == 'x':
-                qc.x(i)
+                circuit.append('x', i)
             elif gate == 'h':
-                qc.h(i)
+                circuit.append('h', i)
             elif gate == 'id':
-                qc.id(i)
+                circuit.append('id', i)
             elif gate == 'y':
-                qc.y(i)
+                circuit.append('y', i)
             elif gate == 'z':
-                qc.z(i)
+                circuit.append('z', i)
             elif gate == 's':
-                qc.s(i)
+                circuit.append('s', i)
             elif gate == 't':
-                qc.t(i)
+                circuit.append('t', i)
             elif gate in ('rx', 'ry', 'rz'):
                 try:
                     deg = float(input(f"Enter angle in degrees for {gate} on qubit {i}: "))
-                    rad = math.radians(deg)
-                    if gate == 'rx':
-                        qc.rx(rad, i)
-                    elif gate == 'ry':
-                        qc.ry(rad, i)
-                    elif gate == 'rz':
-                        qc.rz(rad, i)
+                    circuit.append(gate, i, math.radians(deg))
                 except ValueError:
                     print("Invalid angle, skipping.")
             elif gate == 'cx':
                 try:
                     target = int(input(f"You selected CNOT for qubit {i} as control. Enter target qubit (0 to {n-1}, not {i}): "))
                     if target != i and 0 <= target < n:
-                        qc.cx(i, target)
+                        circuit.append('cx', (i, target))
                     else:
                         print("Invalid target qubit for CNOT.")
                 except ValueError:
@@ -71,10 +67,13 @@ def main():
             else:
                 print(f"Unknown gate '{gate}', skipping on qubit {i}.")
 
-    qc.measure(range(n), range(n))
-    qasm = qiskit.qasm2.dumps(qc)
-    # Remove the include line for Quokka compatibility
-    qasm = qasm.replace('include "qelib1.inc";\n', '')
+    optimized = optimize(circuit)
+    print_report(circuit, optimized)
+    circuit = optimized
+
+    circuit.measure_all()
+    # Omit the include line for Quokka compatibility
+    qasm = circuit.to_qasm(include=False)
     with open("quokka.qasm", "w") as f:
         f.write(qasm)
     print("QASM for Quokka saved to quokka.qasm (without include line)")
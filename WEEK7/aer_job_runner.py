@@ -0,0 +1,85 @@
+"""
+Batched and concurrent Aer job submission.
+
+Many small circuits are grouped into one backend.run() call per batch instead of one call per
+circuit, and statevector and shot batches are submitted as asyncio tasks so they overlap. A
+semaphore caps how many backend calls are in flight at once, and results are collected as the
+batches complete (optionally reported through a callback), then returned in input order.
+With a TranspileCache, each batch is transpiled through the cache before it is run, so circuit
+structures that were compiled before (in this or an earlier process) are not compiled again.
+
+Example:
+    runner = AerJobRunner(max_concurrency=4, batch_size=500)
+    statevectors, counts = runner.run(statevector_circuits=circuits, shot_circuits=circuits,
+                                      shots=2048, seed_simulator=1234)
+"""
+
+import asyncio
+
+from qiskit_aer import Aer
+
+
+class AerJobRunner:
+    """Submit statevector and shot-based circuits to Aer in batches, concurrently."""
+
+    def __init__(self, max_concurrency=4, batch_size=1000,
+                 statevector_backend="statevector_simulator", shots_backend="qasm_simulator", cache=None):
+        if max_concurrency < 1 or batch_size < 1:
+            raise ValueError("max_concurrency and batch_size must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.cache = cache
+        self.statevector_backend = Aer.get_backend(statevector_backend)
+        self.shots_backend = Aer.get_backend(shots_backend)
+
+    def _batches(self, circuits):
+        for start in range(0, len(circuits), self.batch_size):
+            yield start, circuits[start:start + self.batch_size]
+
+    def _run_blocking(self, backend, circuits, options):
+        if self.cache is not None:
+            circuits = self.cache.transpile(circuits, backend)
+        return backend.run(circuits, **options).result()
+
+    async def _submit(self, semaphore, backend, circuits, options):
+        # Transpiling and backend.run(...).result() block, so they run in a worker thread.
+        async with semaphore:
+            return await asyncio.to_thread(self._run_blocking, backend, circuits, options)
+
+    async def run_async(self, statevector_circuits=(), shot_circuits=(), on_result=None, **run_options):
+        """
+        Return (statevectors, counts) lists in the same order as the input circuits.
+
+        Final measurements are removed from statevector circuits. run_options (shots,
+        seed_simulator, ...) are passed to the shot backend. on_result(kind, index, value)
+        is called for every circuit as soon as its batch finishes, with kind "statevector"
+        or "counts".
+        """
+        statevector_circuits = [qc.remove_final_measurements(inplace=False) for qc in statevector_circuits]
+        shot_circuits = list(shot_circuits)
+        statevectors = [None] * len(statevector_circuits)
+        counts = [None] * len(shot_circuits)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def job(kind, start, batch):
+            if kind == "statevector":
+                result = await self._submit(semaphore, self.statevector_backend, batch, {})
+            else:
+                result = await self._submit(semaphore, self.shots_backend, batch, run_options)
+            return kind, start, len(batch), result
+
+        tasks = [job("statevector", start, batch) for start, batch in self._batches(statevector_circuits)]
+        tasks += [job("counts", start, batch) for start, batch in self._batches(shot_circuits)]
+        for finished in asyncio.as_completed(tasks):
+            kind, start, size, result = await finished
+            target = statevectors if kind == "statevector" else counts
+            for offset in range(size):
+                value = result.get_statevector(offset) if kind == "statevector" else result.get_counts(offset)
+                target[start + offset] = value
+                if on_result is not None:
+                    on_result(kind, start + offset, value)
+        return statevectors, counts
+
+    def run(self, statevector_circuits=(), shot_circuits=(), on_result=None, **run_options):
+        """Blocking wrapper around run_async()."""
+        return asyncio.run(self.run_async(statevector_circuits, shot_circuits, on_result, **run_options))
@@ -17,10 +17,12 @@ CNOT, SWAP, the custom "Philip" gate, and a controlled-Z before measurement.
 
 from qiskit import QuantumCircuit
 from qiskit.circuit.library import UnitaryGate
-from qiskit_aer import Aer
 from qiskit.quantum_info import Statevector
 import numpy as np
 
+from aer_job_runner import AerJobRunner
+from transpile_cache import TranspileCache
+
 # --- Build circuit producing |Ψ+> = (|01> + |10>)/√2 ---
 qc = QuantumCircuit(2, 2)
 
@@ -41,11 +43,13 @@ qc.measure([0, 1], [0, 1])
 print("Circuit:")
 print(qc)
 
-# --- Statevector (remove measurements first) ---
-pure_qc = qc.remove_final_measurements(inplace=False)
-sv_backend = Aer.get_backend("statevector_simulator")
-sv_result = sv_backend.run(pure_qc).result()
-sv = sv_result.get_statevector()
+# --- Statevector and shot-based jobs, submitted together ---
+# The runner removes final measurements for the statevector job and overlaps it with the
+# qasm_simulator job instead of waiting for one before starting the other. Transpiled circuits
+# are cached on disk, so re-running the script (e.g. with other shots or seeds) skips transpilation.
+runner = AerJobRunner(max_concurrency=2, cache=TranspileCache())
+(sv,), (counts,) = runner.run(statevector_circuits=[qc], shot_circuits=[qc],
+                              shots=2048, seed_simulator=1234)
 
 print("\nStatevector [|00>, |01>, |10>, |11>]:")
 print(sv)
@@ -64,11 +68,11 @@ phase = sv_array[np.argmax(np.abs(sv_array))] / target_array[np.argmax(np.abs(ta
 assert np.allclose(sv_array, phase * target_array, atol=1e-8), "Numeric check failed"
 print("✓ Verified with numeric check: final state is |Ψ+> (up to global phase)")
 
-# --- Shot-based simulation on qasm_simulator ---
-qasm_backend = Aer.get_backend("qasm_simulator")
-job = qasm_backend.run(qc, shots=2048, seed_simulator=1234)  # transpile happens internally
-result = job.result()
-counts = result.get_counts()
+# Method C: exact measurement distribution from the statevector (no shots needed)
+probs = {str(k): float(p) for k, p in sv.probabilities_dict([0, 1], decimals=12).items()}
+assert np.isclose(probs.get('01', 0), 0.5) and np.isclose(probs.get('10', 0), 0.5), "Exact split is not 50/50"
+print(f"✓ Exact probabilities: {probs}")
 
+# --- Shot-based simulation on qasm_simulator ---
 print("\nCounts (~50/50 for '01' and '10'):")
 print(counts)
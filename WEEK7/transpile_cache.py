@@ -0,0 +1,301 @@
+"""
+Persistent transpilation cache.
+
+Compiled circuits are keyed by a structural hash of the circuit (gate names, operands, parameters,
+and the definitions or matrices of custom gates, but not the circuit name or metadata) plus a
+fingerprint of the backend (name, backend version, supported operations, qiskit version) and the
+transpile options. Entries live in an in-memory LRU and on disk, so repeated runs in the same or
+in a new process skip compilation entirely. Both levels are size bounded: the memory LRU drops its
+least recently used entry and the disk cache removes its least recently used files. When a
+backend's version changes, its on-disk entries are wiped.
+
+Qiskit circuits are stored with qiskit.qpy; cirq circuits (compile_cirq) are stored as cirq JSON.
+
+Example:
+    cache = TranspileCache()
+    compiled = cache.transpile(circuits, backend)   # only unseen structures are transpiled
+    result = backend.run(compiled, shots=2048).result()
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import qiskit
+from qiskit import qpy, transpile
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "quantum_computing", "transpile")
+
+
+def _param_token(param):
+    if isinstance(param, np.ndarray):
+        return hashlib.sha256(np.ascontiguousarray(param).tobytes()).hexdigest() + str(param.shape)
+    if isinstance(param, (int, float, complex, np.number)):
+        return repr(complex(param) if isinstance(param, complex) else float(param))
+    return str(param)
+
+
+def _standard_types():
+    from qiskit.circuit import Barrier
+    from qiskit.circuit.library import UnitaryGate, get_standard_gate_name_mapping
+    types = {name: type(gate) for name, gate in get_standard_gate_name_mapping().items()}
+    types["barrier"] = Barrier
+    types["unitary"] = UnitaryGate  # the matrix is its only parameter
+    return types
+
+
+_STANDARD_TYPES = _standard_types()
+
+
+class _Unhashable(Exception):
+    """An operation whose behaviour cannot be derived from the circuit alone."""
+
+
+def _operation_token(operation, memo):
+    """Hash of what a non-standard operation does: its definition, or else its matrix."""
+    if id(operation) in memo:
+        return memo[id(operation)]
+    definition = getattr(operation, "definition", None)
+    if definition is not None:
+        token = _hash_circuit(definition, memo)
+    else:
+        try:
+            from qiskit.quantum_info import Operator
+            token = _param_token(Operator(operation).data)
+        except Exception as exc:
+            raise _Unhashable(operation.name) from exc
+    memo[id(operation)] = token
+    return token
+
+
+def _hash_circuit(qc, memo):
+    h = hashlib.sha256()
+    h.update(f"{qc.num_qubits},{qc.num_clbits},{_param_token(qc.global_phase)}\n".encode())
+    for instruction in qc.data:
+        operation = instruction.operation
+        qubits = ",".join(str(qc.find_bit(q).index) for q in instruction.qubits)
+        clbits = ",".join(str(qc.find_bit(c).index) for c in instruction.clbits)
+        params = ",".join(_hash_circuit(p, memo) if isinstance(p, qiskit.QuantumCircuit) else _param_token(p)
+                          for p in operation.params)
+        line = f"{operation.name}|{qubits}|{clbits}|{params}|{getattr(operation, 'ctrl_state', '')}"
+        if type(operation) is not _STANDARD_TYPES.get(operation.name):
+            # Custom gates can reuse a standard name or share one with a different body.
+            line += "|" + _operation_token(operation, memo)
+        h.update((line + "\n").encode())
+    return h.hexdigest()
+
+
+def circuit_structure_hash(qc):
+    """
+    SHA-256 of everything that affects compilation of a qiskit circuit, and nothing else.
+
+    Non-standard gates are hashed by their definition (recursively) or, failing that, their
+    matrix. Returns None when an operation has neither; such circuits are not cached.
+    """
+    try:
+        return _hash_circuit(qc, {})
+    except _Unhashable:
+        return None
+
+
+def backend_fingerprint(backend):
+    """Backend identity used for cache keys; a change of any field misses the cache."""
+    operations = getattr(backend, "operation_names", None) or []
+    return {
+        "name": backend.name,
+        "version": str(getattr(backend, "backend_version", "")),
+        "operations": sorted(operations),
+        "qiskit": qiskit.__version__,
+    }
+
+
+class TranspileCache:
+    """Two-level (memory LRU + disk) cache of compiled circuits."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_memory_entries=256, max_disk_entries=4096):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._checked_backends = set()
+        self._disk_counts = {}  # directory -> number of cache files, so stores need no listdir
+        self._lock = threading.RLock()  # the job runner calls in from worker threads
+        self.hits = 0
+        self.misses = 0
+
+    # --- storage ---
+
+    def _backend_dir(self, fingerprint):
+        """Directory for one backend name; wiped when the stored fingerprint's version differs."""
+        name = "".join(c if c.isalnum() or c in "-_." else "_" for c in fingerprint["name"])
+        directory = os.path.join(self.cache_dir, name)
+        if name not in self._checked_backends:
+            version_file = os.path.join(directory, "VERSION")
+            current = json.dumps({k: fingerprint[k] for k in ("version", "qiskit") if k in fingerprint})
+            try:
+                with open(version_file) as f:
+                    stale = f.read() != current
+            except FileNotFoundError:
+                stale = os.path.isdir(directory)
+            if stale:
+                shutil.rmtree(directory, ignore_errors=True)
+            os.makedirs(directory, exist_ok=True)
+            with open(version_file, "w") as f:
+                f.write(current)
+            self._checked_backends.add(name)
+            self._disk_counts[directory] = len(self._disk_entries(directory))
+        return directory
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _disk_entries(directory):
+        return [os.path.join(directory, f) for f in os.listdir(directory) if f != "VERSION"]
+
+    def _evict_disk(self, directory):
+        """Drop the least recently used files; called once per transpile()/compile_cirq() call."""
+        if self._disk_counts.get(directory, 0) <= self.max_disk_entries:
+            return
+        entries = self._disk_entries(directory)
+        excess = len(entries) - self.max_disk_entries
+        if excess > 0:
+            entries.sort(key=os.path.getmtime)
+            for path in entries[:excess]:
+                os.remove(path)
+        self._disk_counts[directory] = min(len(entries), self.max_disk_entries)
+
+    def _lookup(self, key, path, load):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+        if os.path.exists(path):
+            try:
+                value = load(path)
+            except Exception:
+                os.remove(path)  # corrupt or from an incompatible serializer version
+                self._disk_counts[os.path.dirname(path)] -= 1
+            else:
+                os.utime(path)
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def _store(self, key, path, value, dump):
+        self._remember(key, value)
+        if not os.path.exists(path):
+            self._disk_counts[os.path.dirname(path)] += 1
+        tmp = path + ".tmp"
+        dump(value, tmp)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _key(structure, fingerprint, options):
+        payload = json.dumps([structure, fingerprint, options], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._checked_backends.clear()
+            self._disk_counts.clear()
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    # --- qiskit ---
+
+    @staticmethod
+    def _load_qpy(path):
+        with open(path, "rb") as f:
+            return qpy.load(f)[0]
+
+    @staticmethod
+    def _dump_qpy(qc, path):
+        buffer = io.BytesIO()
+        qpy.dump(qc, buffer)
+        with open(path, "wb") as f:
+            f.write(buffer.getvalue())
+
+    def transpile(self, circuits, backend, **transpile_options):
+        """
+        Transpile circuits for backend, reusing cached results for known structures.
+
+        Accepts one circuit or a list and returns the same shape. All misses are transpiled in a
+        single transpile() call; circuits that circuit_structure_hash() cannot hash are transpiled
+        every time. Returned circuits are shared with the cache; do not modify them.
+        """
+        single = not isinstance(circuits, (list, tuple))
+        circuits = [circuits] if single else list(circuits)
+        fingerprint = backend_fingerprint(backend)
+        structures = [circuit_structure_hash(qc) for qc in circuits]
+        keys = [None if structure is None else self._key(structure, fingerprint, transpile_options)
+                for structure in structures]
+        compiled = [None] * len(circuits)
+        pending = {}
+        with self._lock:
+            directory = self._backend_dir(fingerprint)
+            for i, key in enumerate(keys):
+                if key is None:
+                    self.misses += 1
+                    pending[("uncached", i)] = (None, [i])
+                    continue
+                if key in pending:
+                    pending[key][1].append(i)
+                    continue
+                path = os.path.join(directory, key + ".qpy")
+                cached = self._lookup(key, path, self._load_qpy)
+                if cached is None:
+                    pending.setdefault(key, (path, []))[1].append(i)
+                else:
+                    compiled[i] = cached
+        if pending:
+            originals = [circuits[indices[0]] for _, indices in pending.values()]
+            results = transpile(originals, backend, **transpile_options)
+            with self._lock:
+                for (key, (path, indices)), result in zip(pending.items(), results):
+                    if path is not None:
+                        self._store(key, path, result, self._dump_qpy)
+                    for i in indices:
+                        compiled[i] = result
+                self._evict_disk(directory)
+        return compiled[0] if single else compiled
+
+    # --- cirq ---
+
+    def compile_cirq(self, circuit, compile_fn, compile_key, target="cirq.Simulator"):
+        """
+        Return compile_fn(circuit), cached by circuit structure, compile_key, target and cirq version.
+
+        compile_key is a string naming what compile_fn does, including any settings it closes over
+        (e.g. "cz-gateset"); the function itself is not inspected, so give every distinct
+        compile_fn its own key. Use this for expensive steps such as decomposing cirq.MatrixGate
+        oracles:
+            cache.compile_cirq(circuit, lambda c: cirq.optimize_for_target_gateset(
+                c, gateset=cirq.CZTargetGateset()), compile_key="cz-gateset")
+        """
+        import cirq
+        if not isinstance(compile_key, str) or not compile_key:
+            raise ValueError("compile_key must be a non-empty string identifying compile_fn")
+        fingerprint = {"name": target, "version": cirq.__version__, "compile": compile_key}
+        structure = hashlib.sha256(cirq.to_json(circuit).encode()).hexdigest()
+        key = self._key(structure, fingerprint, {})
+        with self._lock:
+            path = os.path.join(self._backend_dir(fingerprint), key + ".json")
+            cached = self._lookup(key, path, lambda p: cirq.read_json(p))
+        if cached is not None:
+            return cached
+        result = compile_fn(circuit)
+        with self._lock:
+            self._store(key, path, result, lambda value, p: cirq.to_json(value, p))
+            self._evict_disk(os.path.dirname(path))
+        return result
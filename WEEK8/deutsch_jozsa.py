@@ -10,6 +10,8 @@ Original file is located at
 import cirq
 import numpy as np
 
+from marginals import marginal_distribution, marginal_probabilities
+
 # Define your 8x8 oracle matrix from the diagram
 oracle_matrix = np.array([
     [0,1,0,0,0,0,0,0],  # |000> -> |001>
@@ -66,8 +68,9 @@ result = sim.run(circuit, repetitions=10)
 outcomes = result.measurements["result"].tolist()
 print("\nMeasurement outcomes:", outcomes)
 
-# Decide constant/balanced
-function_type = "constant" if all(np.array_equal(o, [0,0]) for o in outcomes) else "balanced"
+# Decide constant/balanced from the exact marginal of the input qubits: constant iff P(00) = 1
+print("Exact input-register probabilities:", marginal_distribution(state, [0, 1], threshold=1e-9))
+function_type = "constant" if np.isclose(marginal_probabilities(state, [0, 1])[0], 1, atol=1e-6) else "balanced"
 print("Function type:", function_type)
 
 print("\nCircuit:\n", circuit)
@@ -146,8 +149,9 @@ result = sim.run(circuit, repetitions=10)
 outcomes = result.measurements["result"].tolist()
 print("\nMeasurement outcomes:", outcomes)
 
-# Determine constant vs balanced
-function_type = "constant" if all(np.array_equal(o, [0,0]) for o in outcomes) else "balanced"
+# Determine constant vs balanced exactly: constant iff P(q0 q1 = 00) = 1
+print("Exact input-register probabilities:", marginal_distribution(state, [0, 1], threshold=1e-9))
+function_type = "constant" if np.isclose(marginal_probabilities(state, [0, 1])[0], 1, atol=1e-6) else "balanced"
 print("Function type:", function_type)
 
 # Print circuit
@@ -253,8 +257,9 @@ if __name__ == "__main__":
     shots = ["".join(map(str, row)) for row in result.measurements["result"]]
     print(f"\nMeasurement outcomes ({reps} shots): {shots}")
 
-    # 5) DJ verdict: constant iff all-zero on input register
-    is_constant = all(bits == "00" for bits in shots)
+    # 5) DJ verdict: constant iff the input register is 00 with probability 1 (exact, no shots)
+    print("Exact input-register probabilities:", marginal_distribution(sv, [0, 1], threshold=1e-9))
+    is_constant = np.isclose(marginal_probabilities(sv, [0, 1])[0], 1, atol=1e-6)
     print("Function type:", "constant" if is_constant else "balanced")
 
     print("\nCircuit:\n", circuit)
\ No newline at end of file
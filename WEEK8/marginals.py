@@ -0,0 +1,67 @@
+"""
+Exact marginal probabilities from a statevector, without sampling.
+
+The probabilities |amp|^2 are viewed as an n-axis (2, 2, ..., 2) tensor and summed over the axes
+of the traced-out qubits. For states that are too large to square in one go (or that are
+memory-mapped from a .npy file), pass chunk_size: the state is then reduced one block of
+amplitudes at a time, and each block only touches its own slice of the input.
+
+Qubit ordering defaults to cirq's: qubit 0 is the most significant bit of the state index.
+Pass little_endian=True for qiskit statevectors. In the result, the first qubit listed in
+`qubits` is the most significant bit, matching the bit order of cirq.measure(*qubits).
+"""
+
+import numpy as np
+
+
+def _num_qubits(size):
+    n = int(size).bit_length() - 1
+    if size != 1 << n:
+        raise ValueError(f"State length {size} is not a power of two")
+    return n
+
+
+def marginal_probabilities(state, qubits, little_endian=False, chunk_size=None):
+    """
+    Return P(qubits = k) for k in range(2**len(qubits)) as a float array.
+
+    state may be any 1-D array-like, including a np.memmap. chunk_size (number of amplitudes,
+    rounded down to a power of two) limits how much of the state is squared at once.
+    """
+    state = state if isinstance(state, np.ndarray) else np.asarray(state)
+    n = _num_qubits(state.size)
+    qubits = list(qubits)
+    if len(set(qubits)) != len(qubits) or any(not 0 <= q < n for q in qubits):
+        raise ValueError(f"Invalid qubits {qubits} for a {n}-qubit state")
+    # Tensor axis of each qubit when the flat state is reshaped to (2,) * n.
+    axis_of = (lambda q: n - 1 - q) if little_endian else (lambda q: q)
+    kept_axes = sorted(axis_of(q) for q in qubits)
+    traced_axes = tuple(a for a in range(n) if a not in kept_axes)
+
+    if chunk_size is None or chunk_size >= state.size:
+        probs = np.abs(state.reshape((2,) * n)) ** 2
+        acc = probs.sum(axis=traced_axes)
+    else:
+        # A block of 2**k consecutive amplitudes fixes the top n - k axes to the block number.
+        k = max(int(chunk_size).bit_length() - 1, 0)
+        block = 1 << k
+        high = n - k
+        kept_low = [a for a in kept_axes if a >= high]
+        traced_low = tuple(a - high for a in range(high, n) if a not in kept_low)
+        acc = np.zeros((2,) * len(kept_axes))
+        for b in range(state.size >> k):
+            chunk = np.asarray(state[b * block:(b + 1) * block])
+            partial = (np.abs(chunk.reshape((2,) * k)) ** 2).sum(axis=traced_low)
+            high_bits = tuple((b >> (high - 1 - a)) & 1 for a in kept_axes if a < high)
+            acc[high_bits] += partial
+
+    # acc axes follow increasing tensor axis; reorder them to the requested qubit order.
+    order = [kept_axes.index(axis_of(q)) for q in qubits]
+    return np.transpose(acc, order).reshape(-1) if qubits else acc.reshape(1)
+
+
+def marginal_distribution(state, qubits, little_endian=False, chunk_size=None, threshold=0.0):
+    """Return {bitstring: probability} for outcomes with probability above threshold."""
+    qubits = list(qubits)
+    probs = marginal_probabilities(state, qubits, little_endian, chunk_size)
+    return {format(k, f"0{len(qubits)}b"): float(p) for k, p in enumerate(probs) if p > threshold}